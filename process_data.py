@@ -1,85 +1,138 @@
 import pandas as pd
 import numpy as np
 
-# Read the original CSV file
-df = pd.read_csv('src/data/salaries-2025.csv')
+# Column mappings (using column indices since names are very long)
+columns = {
+    1: 'experience',  # Años de experiencia
+    2: 'max-title-text',  # Nivel de formación
+    6: 'english-level-text',  # Nivel de inglés
+    7: 'main-programming-language',  # Lenguaje principal
+    8: 'workmode',  # Modo de trabajo
+    10: 'company-type',  # Tipo de empresa
+    13: 'currency-usd',  # Currency USD
+    15: 'total-salary-usd',  # Total salary USD
+    16: 'currency-cop',  # Currency COP
+    18: 'total-salary-cop'  # Total salary COP
+}
+
+# Read only the columns we need from the original CSV file
+df = pd.read_csv('src/data/salaries-2025.csv', usecols=list(columns))
+df.columns = list(columns.values())
 
 print(f"Loaded {len(df)} rows from salaries-2025.csv")
 
-# Column mappings (using column indices since names are very long)
-cols = list(df.columns)
-
-# Create mappings for education levels
-education_mapping = {
-    'Bachiller': 1,
-    'Técnica': 2,
-    'Tecnóloga/o': 3,
-    'Pregrado': 4,
-    'Posgrado': 5
-}
+# Convert numeric columns, handling strings and empty values
+for col in ['experience', 'total-salary-usd', 'total-salary-cop']:
+    df[col] = pd.to_numeric(df[col], errors='coerce')
+
+# Drop rows that can never pass the final validation before mapping them
+valid = (
+    df['main-programming-language'].notna() &
+    df['main-programming-language'].ne('') &
+    df['company-type'].notna() &
+    (df['experience'].fillna(0) > -1) &  # min-experience >= 0 once truncated
+    ((df['total-salary-usd'] > 0) | (df['total-salary-cop'] > 0))
+)
+df = df.loc[valid].reset_index(drop=True)
+
+# Create mappings for education levels (position in the list is the level)
+education_levels = [
+    '_unknown',
+    'Bachiller',
+    'Técnica',
+    'Tecnóloga/o',
+    'Pregrado',
+    'Posgrado'
+]
 
 # Create mappings for English levels - simplified
-def map_english_level(text):
-    if pd.isna(text) or text == 'Cero':
-        return 0
-    elif 'A1' in str(text) or 'A2' in str(text):
-        return 1
-    elif 'B1' in str(text):
-        return 2
-    elif 'B2' in str(text):
-        return 3
-    elif 'C1' in str(text) or 'C2' in str(text):
-        return 4
-    else:
-        return 1
+english_mapping = {
+    'Cero': 0,
+    'A1': 1,
+    'A2': 1,
+    'B1': 2,
+    'B2': 3,
+    'C1': 4,
+    'C2': 4
+}
 
 # Create new dataframe with simplified columns
 processed_df = pd.DataFrame()
 
-# Map the columns using indices
-processed_df['experience'] = pd.to_numeric(df.iloc[:, 1], errors='coerce')  # Años de experiencia
-processed_df['max-title-text'] = df.iloc[:, 2]  # Nivel de formación
-processed_df['main-programming-language'] = df.iloc[:, 7]  # Lenguaje principal
-processed_df['workmode'] = df.iloc[:, 8]  # Modo de trabajo
-processed_df['company-type'] = df.iloc[:, 10]  # Tipo de empresa
-processed_df['english-level-text'] = df.iloc[:, 6]  # Nivel de inglés
+# Map the columns
+processed_df['experience'] = df['experience']
+processed_df['max-title-text'] = df['max-title-text']
+processed_df['main-programming-language'] = df['main-programming-language']
+processed_df['workmode'] = df['workmode']
+processed_df['company-type'] = df['company-type']
+processed_df['english-level-text'] = df['english-level-text']
+
+# Low-cardinality text columns are stored as categories
+categorical_cols = [
+    'main-programming-language',
+    'company-type',
+    'workmode',
+    'max-title-text',
+    'english-level-text'
+]
+processed_df[categorical_cols] = processed_df[categorical_cols].astype('category')
 
 # Handle salary data
-processed_df['currency-usd'] = df.iloc[:, 13] # Currency USD
-processed_df['total-salary-usd'] = pd.to_numeric(df.iloc[:, 15], errors='coerce')  # Total salary USD
-processed_df['currency-cop'] = df.iloc[:, 16]  # Currency COP  
-processed_df['total-salary-cop'] = pd.to_numeric(df.iloc[:, 18], errors='coerce')  # Total salary COP
+processed_df['currency-usd'] = df['currency-usd']
+processed_df['total-salary-usd'] = df['total-salary-usd']
+processed_df['currency-cop'] = df['currency-cop']
+processed_df['total-salary-cop'] = df['total-salary-cop']
 
 # Map education levels to numbers
-processed_df['max-title'] = processed_df['max-title-text'].map(education_mapping).fillna(1)
-
-# Map English levels to numbers
-processed_df['english-level'] = processed_df['english-level-text'].apply(map_english_level)
+education_codes = processed_df['max-title-text'].cat.set_categories(
+    education_levels, ordered=True
+).cat.codes
+# Default to 1 if not found
+processed_df['max-title'] = np.where(education_codes < 0, 1, education_codes).astype(np.int8)
+
+# Map English levels to numbers: each category label is resolved once into
+# a lookup table indexed by category code. The trailing 0 is picked up by
+# code -1, so missing text counts as 'Cero'.
+english_categories = processed_df['english-level-text'].cat.categories
+english_lut = np.append(
+    english_categories.str.extract(r'(A1|A2|B1|B2|C1|C2|Cero)', expand=False)
+    .map(english_mapping).fillna(1).to_numpy(dtype=np.int8),
+    np.int8(0)
+)
+processed_df['english-level'] = english_lut[processed_df['english-level-text'].cat.codes.to_numpy()]
 
 # Determine currency and salary - prioritize total compensation
-processed_df['currency'] = 'Pesos'
-processed_df['income-in-currency'] = 0
-
-for idx, row in processed_df.iterrows():
-    # Use USD if available and currency is USD
-    if (pd.notna(row['total-salary-usd']) and 
-        row['total-salary-usd'] > 0 and 
-        str(row['currency-usd']).startswith('Dólares')):
-        processed_df.at[idx, 'currency'] = 'Dólares'
-        processed_df.at[idx, 'income-in-currency'] = row['total-salary-usd']
-    # Otherwise use COP if available
-    elif (pd.notna(row['total-salary-cop']) and 
-          row['total-salary-cop'] > 0 and 
-          str(row['currency-cop']).startswith('Pesos')):
-        processed_df.at[idx, 'currency'] = 'Pesos'
-        processed_df.at[idx, 'income-in-currency'] = row['total-salary-cop']
-
-# Create experience ranges (simple mapping for now)
-processed_df['min-experience'] = processed_df['experience'].fillna(0).astype(int)
-processed_df['max-experience'] = processed_df['experience'].fillna(0).astype(int)
-
-# Clean up company type names
-processed_df['company-type'] = processed_df['company-type'].str.replace('empresa', '', case=False).str.strip()
+is_usd_cur = processed_df['currency-usd'].astype('string').str.startswith('Dólares', na=False)
+is_cop_cur = processed_df['currency-cop'].astype('string').str.startswith('Pesos', na=False)
+# Use USD if available and currency is USD
+usd_mask = (processed_df['total-salary-usd'].notna() &
+            (processed_df['total-salary-usd'] > 0) &
+            is_usd_cur)
+# Otherwise use COP if available
+cop_mask = (processed_df['total-salary-cop'].notna() &
+            (processed_df['total-salary-cop'] > 0) &
+            is_cop_cur &
+            ~usd_mask)
+
+processed_df['currency'] = np.where(usd_mask, 'Dólares', 'Pesos')
+processed_df['income-in-currency'] = np.where(
+    usd_mask,
+    processed_df['total-salary-usd'],
+    np.where(cop_mask, processed_df['total-salary-cop'], 0.0)
+)
+
+# Create experience ranges (simple mapping for now, both ends are the same)
+experience_years = processed_df['experience'].fillna(0).astype(np.int16)
+processed_df['min-experience'] = experience_years
+processed_df['max-experience'] = experience_years
+
+# Clean up company type names on the category labels, not on every row.
+# Mapping the labels also merges any that end up equal after cleaning.
+company_type = processed_df['company-type']
+company_labels = company_type.cat.categories
+processed_df['company-type'] = company_type.map(
+    dict(zip(company_labels, company_labels.str.replace('empresa', '', case=False).str.strip()))
+).astype('category')
 
 # Select final columns matching the original structure
 final_df = processed_df[[
@@ -95,25 +148,38 @@ final_df = processed_df[[
 ]].copy()
 
 # Remove rows with invalid data
-final_df = final_df[
-    (final_df['income-in-currency'] > 0) &
-    (pd.notna(final_df['main-programming-language'])) &
-    (final_df['main-programming-language'] != '') &
-    (pd.notna(final_df['company-type'])) &
-    (final_df['company-type'] != '') &
-    (final_df['min-experience'] >= 0)
-]
-
-# Convert to appropriate data types
-final_df['min-experience'] = final_df['min-experience'].astype(int)
-final_df['max-experience'] = final_df['max-experience'].astype(int)
-final_df['english-level'] = final_df['english-level'].astype(int)
-final_df['max-title'] = final_df['max-title'].astype(int)
-final_df['income-in-currency'] = final_df['income-in-currency'].astype(float)
+language = final_df['main-programming-language']
+company = final_df['company-type']
+valid = np.logical_and.reduce([
+    final_df['income-in-currency'].to_numpy() > 0,
+    language.notna().to_numpy(),
+    language.to_numpy() != '',
+    company.notna().to_numpy(),
+    company.to_numpy() != '',
+    final_df['min-experience'].to_numpy() >= 0
+])
+final_df = final_df.loc[valid]
+
+# Convert to appropriate data types: each integer column gets the smallest signed type
+# that fits its min/max, and they are all cast in one astype (income-in-currency is
+# already float64). -max - 1 needs the same signed type as max.
+integer_cols = ['min-experience', 'max-experience', 'english-level', 'max-title']
+bounds = final_df[integer_cols].agg(['min', 'max'])
+final_df = final_df.astype({
+    col: np.result_type(np.min_scalar_type(min(bounds.at['min', col], -1)),
+                        np.min_scalar_type(-bounds.at['max', col] - 1))
+    for col in integer_cols
+})
 
 # Save the processed file
 final_df.to_csv('src/data/salaries-2025-processed.csv', index=False)
 
+# Also save a Parquet copy, which keeps the dtypes and loads faster
+try:
+    final_df.to_parquet('src/data/salaries-2025-processed.parquet', index=False, compression='zstd')
+except ImportError:
+    print("pyarrow is not installed, skipping salaries-2025-processed.parquet")
+
 print(f"Processed {len(final_df)} valid records")
 print("\nSample of processed data:")
 print(final_df.head())
@@ -6,60 +6,138 @@ Data Elimination Analysis for Colombia Salary Survey 2025
 This script analyzes what data was eliminated during processing and why.
 It compares the original survey responses with the processed dataset.
 
-Usage: python3 analyze_data_elimination.py
+Usage: python3 analyze_data_elimination.py [--mode {full,csv-only,stats-only}]
+
+  full        print the full analysis and save the eliminated records (default)
+  csv-only    only save the eliminated records CSV
+  stats-only  only print the analysis, without saving the eliminated records
 """
 
+import argparse
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+# Survey column names, shared by the analysis functions
+CURRENCY_COL = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas'
+EXPERIENCE_COL = '¿Cuántos años de experiencia en desarrollo de software tiene?'
+LANGUAGE_COL = '¿En cuál de los siguientes lenguajes de programación ocupa la mayor parte de su tiempo laboral?'
+
+# Salary columns (complex names from survey); the COP questions repeat the USD ones
+SALARY_BASE_USD_COL = '¿Cuál es la REMUNERACIÓN BASE ANUAL de su trabajo principal? No incluya otras compensaciones como bonos ni stock. Exprese el valor en la moneda seleccionada anteriormente. Sugerencia: use el ingreso total del año anterior sin incluir stock o bonos por desempeño.'
+SALARY_TOTAL_USD_COL = '¿Cuál es la REMUNERACIÓN TOTAL de su trabajo principal? Incluya otras compensaciones como bonos y stock. Exprese el valor en la moneda seleccionada anteriormente. Sugerencia: use el ingreso total del año anterior incluyendo stock y bonos por desempeño valorados al precio de venta o al final del año.'
+SALARY_BASE_COP_COL = SALARY_BASE_USD_COL + '.1'
+SALARY_TOTAL_COP_COL = SALARY_TOTAL_USD_COL + '.1'
+
+# Only these columns are read from each dataset
+SURVEY_COLUMNS = [
+    CURRENCY_COL, EXPERIENCE_COL, LANGUAGE_COL,
+    SALARY_BASE_USD_COL, SALARY_TOTAL_USD_COL, SALARY_BASE_COP_COL, SALARY_TOTAL_COP_COL
+]
+PROCESSED_COLUMNS = ['currency', 'income-in-currency']
+
+# Salary type of an original record, in category code order
+SALARY_TYPES = ['USD', 'COP', 'Unknown']
+
+# Issues that eliminate a record, in report order; issue i is bit i of the record's issue flags
+ISSUE_NAMES = [
+    'Missing Currency',
+    'Missing All Salaries',
+    'Missing Experience',
+    'Invalid Experience',
+    'Missing Language',
+    'Unrealistic Usd Low',
+    'Unrealistic Usd High',
+    'Unrealistic Cop Low',
+    'Unrealistic Cop High',
+    'Total Less Than Base'
+]
+
+# Rows of the original survey processed at a time
+CHUNK_SIZE = 100_000
+
+@contextmanager
+def buffered_output():
+    """Collect everything printed inside the block and write it to stdout at once."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 def load_datasets():
     """Load both original and processed datasets."""
     try:
-        original_df = pd.read_csv('salaries-2025.csv')
-        processed_df = pd.read_csv('salaries-2025-processed.csv')
-        return original_df, processed_df
+        # The original survey is streamed in chunks, reading only the analysed columns
+        original_chunks = pd.read_csv('salaries-2025.csv', usecols=SURVEY_COLUMNS,
+                                      dtype={EXPERIENCE_COL: 'float64'}, chunksize=CHUNK_SIZE)
+        # Prefer the Parquet copy unless the CSV was regenerated after it
+        parquet_file = Path('salaries-2025-processed.parquet')
+        csv_file = Path('salaries-2025-processed.csv')
+        if parquet_file.exists() and (not csv_file.exists() or
+                                      parquet_file.stat().st_mtime >= csv_file.stat().st_mtime):
+            processed_df = pd.read_parquet(parquet_file, columns=PROCESSED_COLUMNS)
+        else:
+            processed_df = pd.read_csv(csv_file, usecols=PROCESSED_COLUMNS)
+        return original_chunks, processed_df
     except FileNotFoundError as e:
         print(f"Error: Could not find data files. Make sure you're in the data directory.")
         print(f"Missing file: {e.filename}")
         return None, None
 
+def _largest_values(values, k):
+    """Return the k largest values in descending order, sorting only those k."""
+    if k == 0:
+        return values[:0]
+    split = len(values) - k
+    return np.sort(np.partition(values, split)[split:])[::-1]
+
 def analyze_cop_salary_thresholds(processed_df):
     """Analyze COP salary distribution to understand thresholds."""
     print("=" * 60)
     print("COP SALARY ANALYSIS")
     print("=" * 60)
     
-    cop_salaries = processed_df[processed_df['currency'] == 'Pesos']['income-in-currency']
+    cop_salaries = processed_df.loc[processed_df['currency'] == 'Pesos', 'income-in-currency'].to_numpy(dtype=np.float64)
     
     # Current exchange rate (approximate)
     usd_rate = 4300
     
+    # One quantile pass gives the min, max, median and every percentile shown
+    percentiles = [25, 50, 75, 90, 95, 99]
+    cop_min, *quantiles, cop_max = np.quantile(cop_salaries, [0] + [p / 100 for p in percentiles] + [1])
+    cop_mean = cop_salaries.mean()
+    cop_median = quantiles[percentiles.index(50)]
+    
     print(f"Total COP salary records: {len(cop_salaries):,}")
     print(f"\nCOP Salary Statistics:")
-    print(f"  Mean: {cop_salaries.mean()/1e6:.1f}M COP (${cop_salaries.mean()/usd_rate:,.0f} USD)")
-    print(f"  Median: {cop_salaries.median()/1e6:.1f}M COP (${cop_salaries.median()/usd_rate:,.0f} USD)")
-    print(f"  Std Dev: {cop_salaries.std()/1e6:.1f}M COP")
-    print(f"  Min: {cop_salaries.min()/1e6:.1f}M COP (${cop_salaries.min()/usd_rate:,.0f} USD)")
-    print(f"  Max: {cop_salaries.max()/1e6:.1f}M COP (${cop_salaries.max()/usd_rate:,.0f} USD)")
+    print(f"  Mean: {cop_mean/1e6:.1f}M COP (${cop_mean/usd_rate:,.0f} USD)")
+    print(f"  Median: {cop_median/1e6:.1f}M COP (${cop_median/usd_rate:,.0f} USD)")
+    print(f"  Std Dev: {cop_salaries.std(ddof=1)/1e6:.1f}M COP")
+    print(f"  Min: {cop_min/1e6:.1f}M COP (${cop_min/usd_rate:,.0f} USD)")
+    print(f"  Max: {cop_max/1e6:.1f}M COP (${cop_max/usd_rate:,.0f} USD)")
     
     print(f"\nPercentile Analysis:")
-    percentiles = [25, 50, 75, 90, 95, 99]
-    for p in percentiles:
-        val = np.percentile(cop_salaries, p)
+    for p, val in zip(percentiles, quantiles):
         print(f"  {p:2d}th percentile: {val/1e6:6.1f}M COP (${val/usd_rate:8,.0f} USD)")
     
     # Define thresholds
-    p99 = np.percentile(cop_salaries, 99)
+    p99 = quantiles[-1]
     print(f"\n🔍 EXTREMELY HIGH COP SALARIES (>99th percentile = {p99/1e6:.1f}M COP):")
-    extreme_salaries = cop_salaries[cop_salaries > p99]
-    for salary in sorted(extreme_salaries, reverse=True):
+    # The salaries above p99 are exactly the k largest ones
+    extreme_count = np.count_nonzero(cop_salaries > p99)
+    for salary in _largest_values(cop_salaries, extreme_count):
         print(f"  {salary/1e6:6.1f}M COP (${salary/usd_rate:8,.0f} USD)")
     
     # Low salary analysis
     print(f"\n🔍 VERY LOW COP SALARIES (<1M COP = ~${1000000/usd_rate:,.0f} USD):")
     low_salaries = cop_salaries[cop_salaries < 1000000]
-    for salary in sorted(low_salaries):
+    for salary in np.sort(low_salaries):
         print(f"  {salary/1e6:6.1f}M COP (${salary/usd_rate:8,.0f} USD)")
     
     return p99
@@ -70,336 +148,362 @@ def analyze_usd_salary_thresholds(processed_df):
     print("USD SALARY ANALYSIS")
     print("=" * 60)
     
-    usd_salaries = processed_df[processed_df['currency'] == 'Dólares']['income-in-currency']
+    usd_salaries = processed_df.loc[processed_df['currency'] == 'Dólares', 'income-in-currency'].to_numpy(dtype=np.float64)
+    
+    # One quantile pass gives the min, max, median and every percentile shown
+    percentiles = [25, 50, 75, 90, 95, 99]
+    usd_min, *quantiles, usd_max = np.quantile(usd_salaries, [0] + [p / 100 for p in percentiles] + [1])
     
     print(f"Total USD salary records: {len(usd_salaries):,}")
     print(f"\nUSD Salary Statistics:")
     print(f"  Mean: ${usd_salaries.mean():,.0f}")
-    print(f"  Median: ${usd_salaries.median():,.0f}")
-    print(f"  Std Dev: ${usd_salaries.std():,.0f}")
-    print(f"  Min: ${usd_salaries.min():,.0f}")
-    print(f"  Max: ${usd_salaries.max():,.0f}")
+    print(f"  Median: ${quantiles[percentiles.index(50)]:,.0f}")
+    print(f"  Std Dev: ${usd_salaries.std(ddof=1):,.0f}")
+    print(f"  Min: ${usd_min:,.0f}")
+    print(f"  Max: ${usd_max:,.0f}")
     
     print(f"\nPercentile Analysis:")
-    percentiles = [25, 50, 75, 90, 95, 99]
-    for p in percentiles:
-        val = np.percentile(usd_salaries, p)
+    for p, val in zip(percentiles, quantiles):
         print(f"  {p:2d}th percentile: ${val:8,.0f}")
     
     # Define thresholds
-    p99 = np.percentile(usd_salaries, 99)
+    p99 = quantiles[-1]
     print(f"\n🔍 EXTREMELY HIGH USD SALARIES (>99th percentile = ${p99:,.0f}):")
-    extreme_salaries = usd_salaries[usd_salaries > p99]
-    for salary in sorted(extreme_salaries, reverse=True):
+    # The salaries above p99 are exactly the k largest ones
+    extreme_count = np.count_nonzero(usd_salaries > p99)
+    for salary in _largest_values(usd_salaries, extreme_count):
         print(f"  ${salary:8,.0f}")
     
     # Low salary analysis  
     print(f"\n🔍 VERY LOW USD SALARIES (<$2,500):")
     low_salaries = usd_salaries[usd_salaries < 2500]
-    for salary in sorted(low_salaries):
+    for salary in np.sort(low_salaries):
         print(f"  ${salary:8,.0f}")
     
     return p99
 
-def identify_eliminated_records(original_df):
-    """Identify all records that would be eliminated and their reasons."""
-    
-    # Column mappings
-    currency_col = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas'
-    experience_col = '¿Cuántos años de experiencia en desarrollo de software tiene?'
-    language_col = '¿En cuál de los siguientes lenguajes de programación ocupa la mayor parte de su tiempo laboral?'
-    
-    # Get salary columns by position (more reliable than complex names)
-    base_salary_usd_col = 15  # Column 16 (0-indexed)
-    total_salary_usd_col = 16  # Column 17 (0-indexed)
-    base_salary_cop_col = 18  # Column 19 (0-indexed)
-    total_salary_cop_col = 19  # Column 20 (0-indexed)
+def _data_quality_checks(survey):
+    """Build the data quality checks for a chunk of parsed survey columns."""
+    # Work on plain NumPy arrays; the salaries are already numeric
+    # and the currency is matched by category code
+    currency = survey['currency']
+    cur_codes = currency.cat.codes.to_numpy()
+    exp = survey['experience'].to_numpy(dtype=np.float64)
+    lang = survey['language'].to_numpy()
+    usd_base = survey['base_salary_usd'].to_numpy(dtype=np.float64)
+    usd_total = survey['total_salary_usd'].to_numpy(dtype=np.float64)
+    cop_base = survey['base_salary_cop'].to_numpy(dtype=np.float64)
+    cop_total = survey['total_salary_cop'].to_numpy(dtype=np.float64)
+    is_usd = np.isin(cur_codes, np.flatnonzero(currency.cat.categories == 'Dólares americanos (USD)'))
+    is_cop = np.isin(cur_codes, np.flatnonzero(currency.cat.categories == 'Pesos colombianos (COP)'))
+    
+    # Each check is (issue type, row mask, message for a flagged row position)
+    checks = [
+        # Check for missing core data
+        ('missing_currency', cur_codes < 0, lambda i: "Missing currency"),
+        ('missing_experience', np.isnan(exp), lambda i: "Missing experience"),
+        ('missing_language', pd.isna(lang), lambda i: "Missing language"),
+        # Check experience validity
+        ('invalid_experience', np.logical_or(exp < 0, exp > 50),
+         lambda i: f"Invalid experience: {exp[i]}"),
+        # Check if both salaries are missing
+        ('missing_all_salaries', np.logical_and.reduce([is_usd, np.isnan(usd_base), np.isnan(usd_total)]),
+         lambda i: "Missing all USD salaries"),
+        ('missing_all_salaries', np.logical_and.reduce([is_cop, np.isnan(cop_base), np.isnan(cop_total)]),
+         lambda i: "Missing all COP salaries"),
+    ]
+    
+    # Check for unrealistic USD values
+    for sal_name, salary in [('base', usd_base), ('total', usd_total)]:
+        checks += [
+            ('unrealistic_usd_low', np.logical_and(is_usd, salary < 1000),  # Less than $1000 annual
+             lambda i, n=sal_name, s=salary: f"Unrealistic low USD {n}: ${s[i]}"),
+            ('unrealistic_usd_high', np.logical_and(is_usd, salary > 500000),  # More than $500k annual
+             lambda i, n=sal_name, s=salary: f"Unrealistic high USD {n}: ${s[i]}"),
+        ]
+    
+    # Check for unrealistic COP values
+    for sal_name, salary in [('base', cop_base), ('total', cop_total)]:
+        checks += [
+            ('unrealistic_cop_low', np.logical_and(is_cop, salary < 5000000),  # Less than 5M COP (~$1,200) annual
+             lambda i, n=sal_name, s=salary: f"Unrealistic low COP {n}: {s[i]/1e6:.1f}M"),
+            ('unrealistic_cop_high', np.logical_and(is_cop, salary > 1000000000),  # More than 1B COP (~$230k) annual
+             lambda i, n=sal_name, s=salary: f"Unrealistic high COP {n}: {s[i]/1e6:.1f}M"),
+        ]
+    
+    # Check if total < base
+    checks += [
+        ('total_less_than_base', np.logical_and(is_usd, usd_total < usd_base),
+         lambda i: f"Total (${usd_total[i]}) < Base (${usd_base[i]})"),
+        ('total_less_than_base', np.logical_and(is_cop, cop_total < cop_base),
+         lambda i: f"Total ({cop_total[i]/1e6:.1f}M) < Base ({cop_base[i]/1e6:.1f}M)"),
+    ]
+    
+    return checks
+
+def _elimination_issues(survey):
+    """Flag the records of a chunk of parsed survey columns that would be eliminated."""
+    currency = survey['currency']
+    experience = survey['experience']
+    language = survey['language']
+    
+    # Classify each distinct currency label once, then match rows by category code
+    labels = currency.cat.categories.astype('string')
+    is_usd_label = np.asarray(labels.str.contains('USD|Dólares'), dtype=bool)
+    is_cop_label = ~is_usd_label & np.asarray(labels.str.contains('COP|Pesos'), dtype=bool)
+    cur_codes = currency.cat.codes.to_numpy()
+    is_usd = np.isin(cur_codes, np.flatnonzero(is_usd_label))
+    is_cop = np.isin(cur_codes, np.flatnonzero(is_cop_label))
+    salary_type = pd.Categorical.from_codes(np.where(is_usd, 0, np.where(is_cop, 1, 2)),
+                                            categories=SALARY_TYPES)
+    effective_base = survey['base_salary_usd'].where(is_usd, survey['base_salary_cop'].where(is_cop))
+    effective_total = survey['total_salary_usd'].where(is_usd, survey['total_salary_cop'].where(is_cop))
+    
+    # One boolean mask per issue
+    issue_masks = {
+        'Missing Currency': currency.isna() | currency.eq(''),
+        'Missing All Salaries': effective_base.isna() & effective_total.isna(),
+        'Missing Experience': experience.isna(),
+        'Invalid Experience': experience.lt(0) | experience.gt(50),
+        'Missing Language': language.isna() | language.eq(''),
+        # Check for unrealistic values
+        'Unrealistic Usd Low': is_usd & effective_total.gt(0) & effective_total.lt(2500),
+        'Unrealistic Usd High': is_usd & effective_total.gt(500000),
+        'Unrealistic Cop Low': is_cop & effective_total.gt(0) & effective_total.lt(10000000),  # < 10M COP
+        'Unrealistic Cop High': is_cop & effective_total.gt(1000000000),  # > 1B COP
+        # Check if total < base
+        'Total Less Than Base': effective_total.lt(effective_base),
+    }
     
-    eliminated_records = []
+    # Pack the masks into one bit per issue
+    issue_flags = np.zeros(len(currency), dtype=np.uint16)
+    for bit, name in enumerate(ISSUE_NAMES):
+        issue_flags |= np.asarray(issue_masks[name], dtype=np.uint16) << bit
+    
+    # If there are any issues, this record would be eliminated
+    eliminated = issue_flags != 0
+    
+    # Build the eliminated records straight from the filtered columns
+    return pd.DataFrame({
+        'original_index': currency.index[eliminated],
+        'currency': currency.to_numpy()[eliminated],
+        'experience_years': experience.to_numpy()[eliminated],
+        'programming_language': language.to_numpy()[eliminated],
+        'salary_type': salary_type[eliminated],
+        'base_salary_usd': survey['base_salary_usd'].to_numpy()[eliminated],
+        'total_salary_usd': survey['total_salary_usd'].to_numpy()[eliminated],
+        'base_salary_cop': survey['base_salary_cop'].to_numpy()[eliminated],
+        'total_salary_cop': survey['total_salary_cop'].to_numpy()[eliminated],
+        'effective_base_salary': effective_base.to_numpy()[eliminated],
+        'effective_total_salary': effective_total.to_numpy()[eliminated],
+        'issue_flags': issue_flags[eliminated],
+    })
+
+def _decode_issue_flags(issue_flags):
+    """Turn issue bit flags into a categorical of issue labels and the number of issues."""
+    # Each distinct combination of issues is decoded only once
+    unique_flags, codes = np.unique(issue_flags, return_inverse=True)
+    names = [[name for bit, name in enumerate(ISSUE_NAMES) if flag >> bit & 1] for flag in unique_flags]
+    codes = codes.reshape(-1)
+    issues = pd.Categorical.from_codes(codes, categories=['; '.join(row) for row in names])
+    issue_count = np.array([len(row) for row in names], dtype=np.int64)[codes]
+    return issues, issue_count
+
+def analyze_and_collect(original_chunks, collect_quality=True, collect_records=True):
+    """
+    Scan the original survey once, collecting both the data quality issues
+    and the records that would be eliminated.
+    
+    Returns the data quality summary and a DataFrame of the eliminated records
+    (None when collect_records is False). When collect_quality is False only
+    the record count of the summary is filled in.
+    """
+    quality = {
+        'total_records': 0,
+        'issues': {
+            'missing_currency': 0,
+            'missing_experience': 0,
+            'missing_language': 0,
+            'missing_all_salaries': 0,
+            'unrealistic_usd_low': 0,
+            'unrealistic_usd_high': 0,
+            'unrealistic_cop_low': 0,
+            'unrealistic_cop_high': 0,
+            'total_less_than_base': 0,
+            'invalid_experience': 0
+        },
+        'problematic_count': 0,
+        'examples': []
+    }
+    eliminated_chunks = []
     
-    for idx, row in original_df.iterrows():
-        issues = []
-        
-        # Get basic info
-        currency = row.get(currency_col)
-        experience = row.get(experience_col)
-        language = row.get(language_col)
+    for chunk in original_chunks:
+        # Resolve the long column names to positions once per chunk
+        (cur_pos, exp_pos, lang_pos, usd_base_pos, usd_total_pos,
+         cop_base_pos, cop_total_pos) = (chunk.columns.get_loc(col) for col in SURVEY_COLUMNS)
         
-        # Get salary data by position
-        base_salary_usd = row.iloc[base_salary_usd_col] if len(row) > base_salary_usd_col else None
-        total_salary_usd = row.iloc[total_salary_usd_col] if len(row) > total_salary_usd_col else None
-        base_salary_cop = row.iloc[base_salary_cop_col] if len(row) > base_salary_cop_col else None
-        total_salary_cop = row.iloc[total_salary_cop_col] if len(row) > total_salary_cop_col else None
+        # Each column is extracted and parsed once and shared by both sets of checks
+        survey = {
+            'currency': chunk.iloc[:, cur_pos].astype('category'),
+            'experience': chunk.iloc[:, exp_pos],
+            'language': chunk.iloc[:, lang_pos],
+            'base_salary_usd': pd.to_numeric(chunk.iloc[:, usd_base_pos], errors='coerce'),
+            'total_salary_usd': pd.to_numeric(chunk.iloc[:, usd_total_pos], errors='coerce'),
+            'base_salary_cop': pd.to_numeric(chunk.iloc[:, cop_base_pos], errors='coerce'),
+            'total_salary_cop': pd.to_numeric(chunk.iloc[:, cop_total_pos], errors='coerce'),
+        }
         
-        # Check for missing currency
-        if pd.isna(currency) or currency == '':
-            issues.append("Missing Currency")
+        quality['total_records'] += len(chunk)
         
-        # Determine effective salary based on currency
-        if not pd.isna(currency):
-            if 'USD' in str(currency) or 'Dólares' in str(currency):
-                effective_base = base_salary_usd
-                effective_total = total_salary_usd
-                salary_type = "USD"
-            elif 'COP' in str(currency) or 'Pesos' in str(currency):
-                effective_base = base_salary_cop
-                effective_total = total_salary_cop
-                salary_type = "COP"
-            else:
-                effective_base = None
-                effective_total = None
-                salary_type = "Unknown"
-        else:
-            effective_base = None
-            effective_total = None
-            salary_type = "Unknown"
-        
-        # Check for missing all salaries
-        if pd.isna(effective_base) and pd.isna(effective_total):
-            issues.append("Missing All Salaries")
-        
-        # Check experience
-        if pd.isna(experience):
-            issues.append("Missing Experience")
-        elif experience < 0 or experience > 50:
-            issues.append("Invalid Experience")
-        
-        # Check language
-        if pd.isna(language) or language == '':
-            issues.append("Missing Language")
-        
-        # Check for unrealistic values
-        if not pd.isna(effective_total) and effective_total > 0:
-            if salary_type == "USD":
-                if effective_total < 2500:
-                    issues.append("Unrealistic Usd Low")
-                elif effective_total > 500000:
-                    issues.append("Unrealistic Usd High")
-            elif salary_type == "COP":
-                if effective_total < 10000000:  # < 10M COP
-                    issues.append("Unrealistic Cop Low")
-                elif effective_total > 1000000000:  # > 1B COP
-                    issues.append("Unrealistic Cop High")
-        
-        # Check if total < base
-        if not pd.isna(effective_base) and not pd.isna(effective_total):
-            if effective_total < effective_base:
-                issues.append("Total Less Than Base")
+        if collect_quality:
+            checks = _data_quality_checks(survey)
+            for issue_type, mask, _ in checks:
+                quality['issues'][issue_type] += np.count_nonzero(mask)
+            any_issue = np.logical_or.reduce([mask for _, mask, _ in checks])
+            quality['problematic_count'] += np.count_nonzero(any_issue)
+            
+            # Only the first few problematic records are shown, so only those are materialized
+            examples = quality['examples']
+            for pos in np.flatnonzero(any_issue)[:10 - len(examples)]:
+                examples.append({
+                    'index': chunk.index[pos],
+                    'currency': survey['currency'].iat[pos],
+                    'experience': survey['experience'].iat[pos],
+                    'language': survey['language'].iat[pos],
+                    'issues': [message(pos) for _, mask, message in checks if mask[pos]]
+                })
         
-        # If there are any issues, this record would be eliminated
-        if issues:
-            eliminated_records.append({
-                'original_index': idx,
-                'currency': currency,
-                'experience_years': experience,
-                'programming_language': language,
-                'salary_type': salary_type,
-                'base_salary_usd': base_salary_usd,
-                'total_salary_usd': total_salary_usd,
-                'base_salary_cop': base_salary_cop,
-                'total_salary_cop': total_salary_cop,
-                'effective_base_salary': effective_base,
-                'effective_total_salary': effective_total,
-                'issues': '; '.join(issues),
-                'issue_count': len(issues)
-            })
-    
-    return eliminated_records
+        if collect_records:
+            eliminated_chunks.append(_elimination_issues(survey))
+    
+    if not collect_records:
+        return quality, None
+    
+    eliminated_records = pd.concat(eliminated_chunks, ignore_index=True)
+    eliminated_records['issues'], eliminated_records['issue_count'] = _decode_issue_flags(
+        eliminated_records.pop('issue_flags').to_numpy()
+    )
+    return quality, eliminated_records
 
-def save_eliminated_records_csv(eliminated_records):
-    """Save eliminated records to CSV file."""
-    if not eliminated_records:
+def save_eliminated_records_csv(df_eliminated):
+    """Save the eliminated records DataFrame to CSV file."""
+    if df_eliminated.empty:
         print("No eliminated records to save.")
         return None
     
-    df_eliminated = pd.DataFrame(eliminated_records)
-    output_file = 'eliminated_records_2025.csv'
+    # Kept apart from eliminated_records_2025.csv, the report of process_2025_data.py,
+    # which has different columns
+    output_file = 'eliminated_records_2025_analysis.csv'
     df_eliminated.to_csv(output_file, index=False)
     
     print(f"\n💾 ELIMINATED RECORDS SAVED TO CSV:")
     print(f"   File: {output_file}")
-    print(f"   Records: {len(eliminated_records):,}")
+    print(f"   Records: {len(df_eliminated):,}")
     print(f"   Columns: {len(df_eliminated.columns)}")
     
     # Show sample issues breakdown
-    issue_counts = {}
-    for record in eliminated_records:
-        for issue in record['issues'].split('; '):
-            issue_counts[issue] = issue_counts.get(issue, 0) + 1
+    top_issues = df_eliminated['issues'].str.split('; ').explode().value_counts().head(5)
     
     print(f"\n   Top Issues:")
-    for issue, count in sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for issue, count in top_issues.items():
         print(f"     - {issue}: {count:,} records")
     
     return output_file
 
-def analyze_data_quality_issues(original_df):
-    """Analyze the original dataset for data quality issues."""
+def print_data_quality_issues(quality):
+    """Print the data quality summary collected by analyze_and_collect."""
     print("\n" + "=" * 60)
     print("DATA QUALITY ANALYSIS")
     print("=" * 60)
     
-    # Column mappings for easier reference
-    currency_col = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas'
-    experience_col = '¿Cuántos años de experiencia en desarrollo de software tiene?'
-    language_col = '¿En cuál de los siguientes lenguajes de programación ocupa la mayor parte de su tiempo laboral?'
-    
-    # Salary columns (complex names from survey)
-    salary_base_usd = '¿Cuál es la REMUNERACIÓN BASE ANUAL de su trabajo principal? No incluya otras compensaciones como bonos ni stock. Exprese el valor en la moneda seleccionada anteriormente. Sugerencia: use el ingreso total del año anterior sin incluir stock o bonos por desempeño.'
-    salary_total_usd = '¿Cuál es la REMUNERACIÓN TOTAL de su trabajo principal? Incluya otras compensaciones como bonos y stock. Exprese el valor en la moneda seleccionada anteriormente. Sugerencia: use el ingreso total del año anterior incluyendo stock y bonos por desempeño valorados al precio de venta o al final del año.'
-    salary_base_cop = salary_base_usd + '.1'
-    salary_total_cop = salary_total_usd + '.1'
-    
-    print(f"Original dataset: {len(original_df):,} records")
-    
-    issues = {
-        'missing_currency': 0,
-        'missing_experience': 0,
-        'missing_language': 0,
-        'missing_all_salaries': 0,
-        'unrealistic_usd_low': 0,
-        'unrealistic_usd_high': 0,
-        'unrealistic_cop_low': 0,
-        'unrealistic_cop_high': 0,
-        'total_less_than_base': 0,
-        'invalid_experience': 0
-    }
-    
-    problematic_records = []
-    
-    for idx, row in original_df.iterrows():
-        record_issues = []
-        
-        # Check for missing core data
-        if pd.isna(row[currency_col]):
-            issues['missing_currency'] += 1
-            record_issues.append("Missing currency")
-            
-        if pd.isna(row[experience_col]):
-            issues['missing_experience'] += 1
-            record_issues.append("Missing experience")
-            
-        if pd.isna(row[language_col]):
-            issues['missing_language'] += 1
-            record_issues.append("Missing language")
-        
-        # Check experience validity
-        if not pd.isna(row[experience_col]):
-            exp = row[experience_col]
-            if exp < 0 or exp > 50:
-                issues['invalid_experience'] += 1
-                record_issues.append(f"Invalid experience: {exp}")
-        
-        # Analyze salary data based on currency
-        currency = row[currency_col]
-        if currency == 'Dólares americanos (USD)':
-            base_salary = row[salary_base_usd]
-            total_salary = row[salary_total_usd]
-            
-            # Check if both salaries are missing
-            if pd.isna(base_salary) and pd.isna(total_salary):
-                issues['missing_all_salaries'] += 1
-                record_issues.append("Missing all USD salaries")
-            else:
-                # Check for unrealistic USD values
-                for sal_name, salary in [('base', base_salary), ('total', total_salary)]:
-                    if not pd.isna(salary):
-                        if salary < 1000:  # Less than $1000 annual
-                            issues['unrealistic_usd_low'] += 1
-                            record_issues.append(f"Unrealistic low USD {sal_name}: ${salary}")
-                        elif salary > 500000:  # More than $500k annual
-                            issues['unrealistic_usd_high'] += 1
-                            record_issues.append(f"Unrealistic high USD {sal_name}: ${salary}")
-                
-                # Check if total < base
-                if not pd.isna(base_salary) and not pd.isna(total_salary) and total_salary < base_salary:
-                    issues['total_less_than_base'] += 1
-                    record_issues.append(f"Total (${total_salary}) < Base (${base_salary})")
-                    
-        elif currency == 'Pesos colombianos (COP)':
-            base_salary = row[salary_base_cop]
-            total_salary = row[salary_total_cop]
-            
-            # Check if both salaries are missing
-            if pd.isna(base_salary) and pd.isna(total_salary):
-                issues['missing_all_salaries'] += 1
-                record_issues.append("Missing all COP salaries")
-            else:
-                # Check for unrealistic COP values
-                for sal_name, salary in [('base', base_salary), ('total', total_salary)]:
-                    if not pd.isna(salary):
-                        if salary < 5000000:  # Less than 5M COP (~$1,200) annual
-                            issues['unrealistic_cop_low'] += 1
-                            record_issues.append(f"Unrealistic low COP {sal_name}: {salary/1e6:.1f}M")
-                        elif salary > 1000000000:  # More than 1B COP (~$230k) annual
-                            issues['unrealistic_cop_high'] += 1
-                            record_issues.append(f"Unrealistic high COP {sal_name}: {salary/1e6:.1f}M")
-                
-                # Check if total < base
-                if not pd.isna(base_salary) and not pd.isna(total_salary) and total_salary < base_salary:
-                    issues['total_less_than_base'] += 1
-                    record_issues.append(f"Total ({total_salary/1e6:.1f}M) < Base ({base_salary/1e6:.1f}M)")
-        
-        # Store problematic records
-        if record_issues:
-            problematic_records.append({
-                'index': idx,
-                'currency': currency,
-                'experience': row[experience_col],
-                'language': row[language_col],
-                'issues': record_issues
-            })
+    total_records = quality['total_records']
+    issues = quality['issues']
+    problematic_count = quality['problematic_count']
+    print(f"Original dataset: {total_records:,} records")
     
     # Print summary
     print(f"\nIssue Summary:")
     total_issues = sum(issues.values())
     for issue_type, count in issues.items():
-        percentage = (count / len(original_df)) * 100
+        percentage = (count / total_records) * 100
         print(f"  {issue_type.replace('_', ' ').title()}: {count:,} ({percentage:.1f}%)")
     
-    print(f"\nTotal records with issues: {len(problematic_records):,}")
+    print(f"\nTotal records with issues: {problematic_count:,}")
     print(f"Total individual issues found: {total_issues:,}")
     
     # Show examples of problematic records
     print(f"\n🔍 EXAMPLES OF PROBLEMATIC RECORDS:")
-    for i, record in enumerate(problematic_records[:10]):  # Show first 10
+    for i, record in enumerate(quality['examples']):
         print(f"\nRecord {i+1} (Index {record['index']}):")
         print(f"  Currency: {record['currency']}")
         print(f"  Experience: {record['experience']}")
         print(f"  Language: {record['language']}")
         print(f"  Issues: {'; '.join(record['issues'])}")
     
-    if len(problematic_records) > 10:
-        print(f"\n... and {len(problematic_records) - 10:,} more problematic records")
+    if problematic_count > 10:
+        print(f"\n... and {problematic_count - 10:,} more problematic records")
     
-    return len(problematic_records)
+    return problematic_count
+
+def parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(
+        description="Analyze what data was eliminated while processing the 2025 salary survey."
+    )
+    parser.add_argument(
+        '--mode', choices=['full', 'csv-only', 'stats-only'], default='full',
+        help="full: analysis and CSV export (default); csv-only: only export the eliminated "
+             "records; stats-only: only print the analysis"
+    )
+    return parser.parse_args()
 
 def main():
     """Main analysis function."""
+    args = parse_args()
+    
     print("COLOMBIA SALARY SURVEY 2025 - DATA ELIMINATION ANALYSIS")
     print("=" * 60)
     
     # Load datasets
-    original_df, processed_df = load_datasets()
-    if original_df is None or processed_df is None:
+    original_chunks, processed_df = load_datasets()
+    if original_chunks is None or processed_df is None:
         return
     
+    # Check the original data for quality issues and eliminated records in one pass,
+    # skipping whichever part the selected mode does not report
+    quality, eliminated_records = analyze_and_collect(
+        original_chunks,
+        collect_quality=args.mode != 'csv-only',
+        collect_records=args.mode != 'stats-only'
+    )
+    original_count = quality['total_records']
+    
     print(f"📊 Dataset Overview:")
-    print(f"  Original records: {len(original_df):,}")
+    print(f"  Original records: {original_count:,}")
     print(f"  Processed records: {len(processed_df):,}")
-    eliminated = len(original_df) - len(processed_df)
-    print(f"  Eliminated records: {eliminated:,} ({eliminated/len(original_df)*100:.1f}%)")
+    eliminated = original_count - len(processed_df)
+    print(f"  Eliminated records: {eliminated:,} ({eliminated/original_count*100:.1f}%)")
+    
+    if args.mode == 'csv-only':
+        with buffered_output():
+            save_eliminated_records_csv(eliminated_records)
+        return
     
     # Analyze salary thresholds in processed data
-    cop_threshold = analyze_cop_salary_thresholds(processed_df)
-    usd_threshold = analyze_usd_salary_thresholds(processed_df)
+    with buffered_output():
+        cop_threshold = analyze_cop_salary_thresholds(processed_df)
+    with buffered_output():
+        usd_threshold = analyze_usd_salary_thresholds(processed_df)
     
-    # Analyze data quality issues in original data
-    problematic_count = analyze_data_quality_issues(original_df)
+    # Report data quality issues in original data
+    with buffered_output():
+        problematic_count = print_data_quality_issues(quality)
     
-    # Identify and save eliminated records to CSV
-    eliminated_records = identify_eliminated_records(original_df)
-    csv_file = save_eliminated_records_csv(eliminated_records)
+    # Save eliminated records to CSV
+    csv_file = None
+    if args.mode == 'full':
+        with buffered_output():
+            csv_file = save_eliminated_records_csv(eliminated_records)
     
     # Final summary
     print("\n" + "=" * 60)
@@ -413,10 +517,10 @@ def main():
     
     print(f"\n📊 Data Quality:")
     print(f"  Records with data quality issues: {problematic_count:,}")
-    print(f"  Estimated elimination rate: {eliminated/len(original_df)*100:.1f}%")
+    print(f"  Estimated elimination rate: {eliminated/original_count*100:.1f}%")
     
     print(f"\n💡 Recommendations:")
-    print(f"  - The {eliminated/len(original_df)*100:.1f}% elimination rate is reasonable for survey data")
+    print(f"  - The {eliminated/original_count*100:.1f}% elimination rate is reasonable for survey data")
     print(f"  - Most eliminations were due to missing/invalid salary data")
     print(f"  - Remaining {len(processed_df):,} records provide reliable salary insights")
     print(f"  - Consider data validation in future surveys to reduce elimination")
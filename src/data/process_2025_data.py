@@ -13,271 +13,395 @@ The processing includes:
 - Using "remuneración total" as the primary salary field
 - Filtering out invalid/incomplete records
 
-Usage: python3 process_2025_data.py
+Usage: python3 process_2025_data.py [--show-eliminated]
+
+  --show-eliminated  also show the eliminated records report (see show_all_eliminated.py)
 """
 #TODO Review english level mapping and experience age ranges
+import argparse
+import re
 import pandas as pd
 import numpy as np
+from pathlib import Path
+
+# Text answers use Arrow-backed strings when pyarrow is available. read_csv's
+# dtype_backend='pyarrow' needs pandas 2, which requirements.txt excludes.
+try:
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    STRING_DTYPE = pd.StringDtype()
+
+# Column mappings from Spanish to our processing needs
+CURRENCY_COL_1 = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas'
+CURRENCY_COL_2 = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas.1'
+EXPERIENCE_COL = '¿Cuántos años de experiencia en desarrollo de software tiene?'
+LANGUAGE_COL = '¿En cuál de los siguientes lenguajes de programación ocupa la mayor parte de su tiempo laboral?'
+EDUCATION_COL = '¿Cuál es su nivel de formación académica?'
+ENGLISH_COL = '¿Cuál es su nivel de inglés? Marco de referencia Europeo'
+COMPANY_COL = '¿Para qué tipo de empresa trabaja?'
+WORKMODE_COL = 'Su modo de trabajo es'
+CONTRACT_COL = '¿Cuál es el tipo de contrato que tiene con la empresa dónde ejerce su trabajo principal?'
+
+# Salary columns - using position is more reliable
+TOTAL_SALARY_1_COL = 15  # Total salary first set ("remuneración total")
+TOTAL_SALARY_2_COL = 18  # Total salary second set ("remuneración total")
+
+# Elimination report, with one row per eliminated record
+ELIMINATED_FILE = 'eliminated_records_2025.csv'
+
+# Issue message prefix -> category shown in the eliminated records report
+ISSUE_CATEGORIES = {
+    'Missing currency': "Missing Currency",
+    'Missing salary': "Missing Salary",
+    'Missing experience': "Missing Experience",
+    'Missing language': "Missing Language",
+    'Unknown currency type': "Unknown Currency",
+    'Invalid experience': "Invalid Experience",
+    'Unrealistic low USD': "Unrealistic USD (Low)",
+    'Unrealistic high USD': "Unrealistic USD (High)",
+    'Unrealistic low COP': "Unrealistic COP (Low)",
+    'Unrealistic high COP': "Unrealistic COP (High)"
+}
+ISSUE_PATTERN = '^(' + '|'.join(re.escape(prefix) for prefix in ISSUE_CATEGORIES) + ')'
+
+def to_float(values):
+    """Convert salary values to float, with NaN for empty or non-numeric values."""
+    # to_numeric finds the parseable values; astype keeps Python's exact float parsing
+    numeric = pd.to_numeric(values, errors='coerce')
+    return values.where(numeric.notna()).astype(float)
+
+def contains(values, pattern):
+    """Return a boolean array telling which values contain the regex pattern."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Test each distinct answer once; the trailing False is picked up by missing values (code -1)
+        labels = values.cat.categories.astype(STRING_DTYPE)
+        matches = labels.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        return np.append(matches, False)[values.cat.codes.to_numpy()]
+    return values.astype(STRING_DTYPE).str.contains(pattern, na=False).to_numpy(dtype=bool)
+
+def recode(values, rules, default):
+    """
+    Recode text answers with an ordered mapping of regex pattern -> value.
+    
+    Every pattern is matched in one vectorized pass and np.select picks, per answer,
+    the value of the first pattern that matches, or default when none does.
+    """
+    return np.select([contains(values, pattern) for pattern in rules], list(rules.values()), default=default)
 
 def load_and_process_data():
     """Load and process the 2025 salary survey data."""
     
-    # Load the original data
+    # Load only the columns we need; the salary positions are resolved to names from the header
     print("Loading original 2025 data...")
-    df = pd.read_csv('salaries-2025.csv')
+    header = pd.read_csv('salaries-2025.csv', nrows=0, encoding='utf-8').columns
+    total_salary_1_name = header[TOTAL_SALARY_1_COL]
+    total_salary_2_name = header[TOTAL_SALARY_2_COL]
+    df = pd.read_csv(
+        'salaries-2025.csv',
+        engine='c',
+        encoding='utf-8',
+        usecols=[
+            CURRENCY_COL_1, CURRENCY_COL_2, EXPERIENCE_COL, LANGUAGE_COL, EDUCATION_COL,
+            ENGLISH_COL, COMPANY_COL, WORKMODE_COL, CONTRACT_COL,
+            total_salary_1_name, total_salary_2_name
+        ],
+        # Currency answers are stored as strings, low-cardinality answers as categories
+        dtype={
+            CURRENCY_COL_1: STRING_DTYPE,
+            CURRENCY_COL_2: STRING_DTYPE,
+            EXPERIENCE_COL: 'float64',
+            LANGUAGE_COL: 'category',
+            EDUCATION_COL: 'category',
+            ENGLISH_COL: 'category',
+            COMPANY_COL: 'category',
+            WORKMODE_COL: 'category',
+            CONTRACT_COL: 'category'
+        }
+    )
     print(f"Original records: {len(df)}")
     
-    # Column mappings from Spanish to our processing needs
-    currency_col_1 = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas'
-    currency_col_2 = '¿A usted le pagan en pesos colombianos (COP) o dólares americanos (USD) en su trabajo principal? Si le pagan en otra moneda seleccione dólares y convierta a la tasa de cambio del día que realizó la encuesta para las próximas preguntas.1'
-    experience_col = '¿Cuántos años de experiencia en desarrollo de software tiene?'
-    language_col = '¿En cuál de los siguientes lenguajes de programación ocupa la mayor parte de su tiempo laboral?'
-    education_col = '¿Cuál es su nivel de formación académica?'
-    english_col = '¿Cuál es su nivel de inglés? Marco de referencia Europeo'
-    company_col = '¿Para qué tipo de empresa trabaja?'
-    workmode_col = 'Su modo de trabajo es'
-    contract_col = '¿Cuál es el tipo de contrato que tiene con la empresa dónde ejerce su trabajo principal?'
-    
-    # Salary columns - using position is more reliable
-    # First set of salary questions (columns 14-15)
-    base_salary_1_col = 14   # Base salary first set
-    total_salary_1_col = 15  # Total salary first set ("remuneración total")
-    # Second set of salary questions (columns 17-18) 
-    base_salary_2_col = 17   # Base salary second set
-    total_salary_2_col = 18  # Total salary second set ("remuneración total")
-    
-    processed_records = []
-    elimination_reasons = []
-    
-    for idx, row in df.iterrows():
-        # Get basic information
-        currency_1 = row.get(currency_col_1)
-        currency_2 = row.get(currency_col_2)
-        experience = row.get(experience_col)
-        language = row.get(language_col)
-        education = row.get(education_col)
-        english_level = row.get(english_col)
-        company_type = row.get(company_col)
-        workmode = row.get(workmode_col)
-        contract_type = row.get(contract_col)
-        
-        # Get salary data by position - check both sets
-        total_salary_1 = row.iloc[total_salary_1_col] if len(row) > total_salary_1_col else None
-        total_salary_2 = row.iloc[total_salary_2_col] if len(row) > total_salary_2_col else None
-        
-        # Convert salary values to numeric, handling strings and empty values
-        def safe_numeric(value):
-            if pd.isna(value) or value == '':
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        
-        total_salary_1 = safe_numeric(total_salary_1)
-        total_salary_2 = safe_numeric(total_salary_2)
-        
-        # Determine which set of data to use (prefer the one that has currency data)
-        if not pd.isna(currency_1) and currency_1 != '':
-            currency = currency_1
-            salary = total_salary_1
-        elif not pd.isna(currency_2) and currency_2 != '':
-            currency = currency_2
-            salary = total_salary_2
-        else:
-            currency = None
-            salary = None
-        
-        # Track elimination reasons
-        issues = []
-        
-        # Check for missing essential data
-        if pd.isna(currency) or currency == '':
-            issues.append("Missing currency")
-        
-        if pd.isna(experience):
-            issues.append("Missing experience")
-        
-        if pd.isna(language) or language == '':
-            issues.append("Missing language")
-        
-        # Determine currency type and salary value
-        if not pd.isna(currency):
-            if 'USD' in str(currency) or 'Dólares' in str(currency):
-                currency_simple = 'Dólares'
-            elif 'COP' in str(currency) or 'Pesos' in str(currency):
-                currency_simple = 'Pesos'
-            else:
-                currency_simple = None
-                issues.append("Unknown currency type")
-        else:
-            currency_simple = None
-        
-        # Check for missing salary
-        if pd.isna(salary):
-            issues.append("Missing salary")
-        
-        # Check for unrealistic salary values
-        if not pd.isna(salary) and salary > 0:
-            if currency_simple == 'Dólares':
-                if salary < 5000:  # Less than $5k annual
-                    issues.append(f"Unrealistic low USD salary: ${salary}")
-                elif salary > 500000:  # More than $500k annual
-                    issues.append(f"Unrealistic high USD salary: ${salary}")
-            elif currency_simple == 'Pesos':
-                if salary < 10000000:  # Less than 10M COP
-                    issues.append(f"Unrealistic low COP salary: {salary/1e6:.1f}M")
-                elif salary > 1000000000:  # More than 1B COP
-                    issues.append(f"Unrealistic high COP salary: {salary/1e6:.1f}M")
-        
-        # Check for invalid experience
-        if not pd.isna(experience):
-            if experience < 0 or experience > 50:
-                issues.append(f"Invalid experience: {experience}")
-        
-        # If there are issues, record elimination and skip
-        if issues:
-            elimination_reasons.append({
-                'index': idx,
-                'issues': '; '.join(issues),
-                'currency': currency,
-                'experience': experience,
-                'language': language,
-                'salary_1': total_salary_1,
-                'salary_2': total_salary_2
-            })
-            continue
-        
-        # Process the valid record
-        try:
-            # Map education level to numeric (1-6)
-            education_mapping = {
-                'Ninguna': 1,
-                'Bachiller': 2,
-                'Técnica': 3,
-                'Tecnóloga/o': 4,
-                'Pregrado': 5,
-                'Posgrado': 6
-            }
-            education_numeric = education_mapping.get(education, 1)  # Default to 1 if not found
-            
-            # Map English level to numeric (0-4)
-            english_mapping = {
-                'A1': 0,
-                'A2': 1,
-                'B1': 2,
-                'B2': 3,
-                'C1': 4,
-                'C2': 4
-            }
-            # Extract level from the full description
-            english_numeric = 0  # Default
-            if not pd.isna(english_level):
-                for level, value in english_mapping.items():
-                    if level in str(english_level):
-                        english_numeric = value
-                        break
-            
-            # Simplify company type
-            company_simple = "Sin Respuesta"
-            if not pd.isna(company_type):
-                if 'Extranjera' in str(company_type):
-                    company_simple = "Extranjera"
-                elif 'mercado extranjero' in str(company_type):
-                    company_simple = "Colombiana con mercado extranjero"
-                elif 'mercado nacional' in str(company_type):
-                    company_simple = "Colombiana con mercado nacional"
-                elif 'independiente' in str(company_type) or 'Freelance' in str(company_type):
-                    company_simple = "Soy independiente (Freelance)"
-            
-            # Simplify workmode
-            workmode_simple = "Sin Respuesta"
-            if not pd.isna(workmode):
-                if 'Remoto' in str(workmode):
-                    workmode_simple = "Remoto"
-                elif 'Presencial' in str(workmode):
-                    workmode_simple = "Presencial"
-                elif 'Híbrido' in str(workmode):
-                    workmode_simple = "Híbrido"
-            
-            # Simplify contract type
-            contract_simple = "Sin Respuesta"
-            if not pd.isna(contract_type):
-                if 'Laboral' in str(contract_type):
-                    contract_simple = "Laboral"
-                elif 'Prestación de servicios' in str(contract_type) or 'Contractor' in str(contract_type) or 'Independiente' in str(contract_type):
-                    contract_simple = "Prestación de servicios/Contractor/Independiente"
-            
-            # Create the processed record
-            processed_record = {
-                'currency': currency_simple,
-                'main-programming-language': language,
-                'company-type': company_simple,
-                'workmode': workmode_simple,
-                'contract-type': contract_simple,
-                'min-experience': int(experience),
-                'max-experience': int(experience),
-                'english-level': english_numeric,
-                'max-title': education_numeric,
-                'income-in-currency': float(salary)
-            }
-            
-            processed_records.append(processed_record)
-            
-        except Exception as e:
-            elimination_reasons.append({
-                'index': idx,
-                'issues': f'Processing error: {str(e)}',
-                'currency': currency,
-                'experience': experience,
-                'language': language,
-                'salary_1': total_salary_1,
-                'salary_2': total_salary_2
-            })
-    
-    return processed_records, elimination_reasons
+    # Empty answers are turned into missing values once, so every check below is a plain isna()
+    for col in [CURRENCY_COL_1, CURRENCY_COL_2]:
+        df[col] = df[col].replace('', pd.NA)
+    for col in [LANGUAGE_COL, EDUCATION_COL, ENGLISH_COL, COMPANY_COL, WORKMODE_COL, CONTRACT_COL]:
+        if '' in df[col].cat.categories:
+            df[col] = df[col].cat.remove_categories('')
+    
+    # Get salary data - check both sets.
+    # Convert salary values to numeric, handling strings and empty values
+    total_salary_1 = to_float(df[total_salary_1_name])
+    total_salary_2 = to_float(df[total_salary_2_name])
+    
+    currency_1 = df[CURRENCY_COL_1]
+    currency_2 = df[CURRENCY_COL_2]
+    experience = df[EXPERIENCE_COL]
+    language = df[LANGUAGE_COL]
+    
+    # Determine which set of data to use (prefer the one that has currency data)
+    has_currency_1 = currency_1.notna()
+    has_currency_2 = ~has_currency_1 & currency_2.notna()
+    currency = currency_1.where(has_currency_1, currency_2.where(has_currency_2))
+    salary = total_salary_1.where(has_currency_1, total_salary_2.where(has_currency_2))
+    
+    # Determine currency type
+    is_usd = contains(currency, 'USD|Dólares')
+    is_cop = ~is_usd & contains(currency, 'COP|Pesos')
+    currency_simple = np.select([is_usd, is_cop], ['Dólares', 'Pesos'], default=None)
+    
+    # Track elimination reasons: one mask per issue, and the issue messages of each record
+    issue_masks = {}
+    issues = pd.Series('', index=df.index, dtype=object)
+    
+    def add_issue(name, mask, messages=None):
+        # messages holds one message per flagged record; by default it is the issue name
+        mask = np.asarray(mask, dtype=bool)
+        issue_masks[name] = mask
+        flagged = issues[mask].to_numpy()
+        message = name if messages is None else np.asarray(messages, dtype=object)
+        issues[mask] = flagged + np.where(flagged == '', '', '; ').astype(object) + message
+    
+    # Check for missing essential data
+    add_issue("Missing currency", currency.isna())
+    add_issue("Missing experience", experience.isna())
+    add_issue("Missing language", language.isna())
+    add_issue("Unknown currency type", currency.notna() & ~is_usd & ~is_cop)
+    
+    # Check for missing salary
+    add_issue("Missing salary", salary.isna())
+    
+    # Check for unrealistic salary values
+    salary_values = salary.to_numpy()
+    positive = salary_values > 0
+    usd_low = positive & is_usd & (salary_values < 5000)  # Less than $5k annual
+    usd_high = positive & is_usd & (salary_values > 500000)  # More than $500k annual
+    cop_low = positive & is_cop & (salary_values < 10000000)  # Less than 10M COP
+    cop_high = positive & is_cop & (salary_values > 1000000000)  # More than 1B COP
+    add_issue("Unrealistic low USD salary", usd_low,
+              [f"Unrealistic low USD salary: ${value}" for value in salary[usd_low]])
+    add_issue("Unrealistic high USD salary", usd_high,
+              [f"Unrealistic high USD salary: ${value}" for value in salary[usd_high]])
+    add_issue("Unrealistic low COP salary", cop_low,
+              [f"Unrealistic low COP salary: {value/1e6:.1f}M" for value in salary[cop_low]])
+    add_issue("Unrealistic high COP salary", cop_high,
+              [f"Unrealistic high COP salary: {value/1e6:.1f}M" for value in salary[cop_high]])
+    
+    # Check for invalid experience
+    invalid_experience = experience.lt(0) | experience.gt(50)
+    add_issue("Invalid experience", invalid_experience,
+              [f"Invalid experience: {value}" for value in experience[invalid_experience]])
+    
+    # Stack the masks into one issue x record matrix; records with any issue are eliminated
+    issue_names = list(issue_masks)
+    issue_matrix = np.vstack(list(issue_masks.values()))
+    eliminated = issue_matrix.any(axis=0)
+    
+    # Records per issue are row sums of the matrix. Issues are listed in the order they
+    # first occur (by record, then by check), so equal counts keep a stable order.
+    counts = np.count_nonzero(issue_matrix, axis=1)
+    first_seen = issue_matrix.argmax(axis=1)
+    issue_counts = {issue_names[i]: int(counts[i])
+                    for i in sorted(np.flatnonzero(counts), key=lambda i: (first_seen[i], i))}
+    elimination_reasons = pd.DataFrame({
+        'index': df.index[eliminated],
+        'issues': issues[eliminated],
+        'currency': currency[eliminated],
+        'experience': experience[eliminated],
+        'language': language[eliminated],
+        'salary_1': total_salary_1[eliminated],
+        'salary_2': total_salary_2[eliminated]
+    })
+    
+    # Process the valid records
+    valid = ~eliminated
+    
+    # Map education level to numeric (1-6)
+    education_mapping = {
+        'Ninguna': 1,
+        'Bachiller': 2,
+        'Técnica': 3,
+        'Tecnóloga/o': 4,
+        'Pregrado': 5,
+        'Posgrado': 6
+    }
+    # Each category label is mapped once into a lookup table indexed by category code.
+    # The trailing 1 is picked up by code -1, so missing education defaults to 1 as well.
+    education = df.loc[valid, EDUCATION_COL]
+    education_lut = np.append(
+        education.cat.categories.map(education_mapping).fillna(1).to_numpy(dtype=int),  # Default to 1 if not found
+        1
+    )
+    education_numeric = education_lut[education.cat.codes.to_numpy()]
+    
+    # Map English level to numeric (0-4)
+    english_mapping = {
+        'A1': 0,
+        'A2': 1,
+        'B1': 2,
+        'B2': 3,
+        'C1': 4,
+        'C2': 4
+    }
+    # Extract level from the full description
+    english_numeric = recode(df.loc[valid, ENGLISH_COL], english_mapping, default=0)
+    
+    # Simplify company type
+    company_types = {
+        'Extranjera': "Extranjera",
+        'mercado extranjero': "Colombiana con mercado extranjero",
+        'mercado nacional': "Colombiana con mercado nacional",
+        'independiente|Freelance': "Soy independiente (Freelance)"
+    }
+    company_simple = recode(df.loc[valid, COMPANY_COL], company_types, default="Sin Respuesta")
+    
+    # Simplify workmode
+    workmodes = {
+        'Remoto': "Remoto",
+        'Presencial': "Presencial",
+        'Híbrido': "Híbrido"
+    }
+    workmode_simple = recode(df.loc[valid, WORKMODE_COL], workmodes, default="Sin Respuesta")
+    
+    # Simplify contract type
+    contract_types = {
+        'Laboral': "Laboral",
+        'Prestación de servicios|Contractor|Independiente': "Prestación de servicios/Contractor/Independiente"
+    }
+    contract_simple = recode(df.loc[valid, CONTRACT_COL], contract_types, default="Sin Respuesta")
+    
+    # Create the processed records column by column, with the smallest integer types that fit
+    # (experience is within 0-50 here). The income stays float64 to keep every salary exact.
+    experience_years = experience[valid].astype(np.int8)
+    processed_records = pd.DataFrame({
+        'currency': currency_simple[valid],
+        'main-programming-language': language[valid],
+        'company-type': company_simple,
+        'workmode': workmode_simple,
+        'contract-type': contract_simple,
+        'min-experience': experience_years,
+        'max-experience': experience_years,
+        'english-level': english_numeric.astype(np.int8),
+        'max-title': education_numeric.astype(np.int8),
+        'income-in-currency': salary[valid].astype(float)
+    })
+    
+    return processed_records, elimination_reasons, issue_counts
 
-def save_processed_data(processed_records, elimination_reasons):
+def save_processed_data(processed_records, elimination_reasons, issue_counts):
     """Save the processed data and elimination report."""
     
     # Save processed data
-    df_processed = pd.DataFrame(processed_records)
-    df_processed.to_csv('salaries-2025-processed.csv', index=False)
+    df_processed = processed_records
+    df_processed.to_csv('salaries-2025-processed.csv', index=False, chunksize=50000, lineterminator='\n')
+    
+    # Also save a Parquet copy, which keeps the dtypes and loads faster
+    try:
+        df_processed.to_parquet('salaries-2025-processed.parquet', index=False, compression='zstd')
+    except ImportError:
+        print("pyarrow is not installed, skipping salaries-2025-processed.parquet")
     
     print(f"\n✅ PROCESSING COMPLETE:")
     print(f"   Processed records: {len(processed_records)}")
     print(f"   Eliminated records: {len(elimination_reasons)}")
     print(f"   Output file: salaries-2025-processed.csv")
     
-    # Save elimination report
-    if elimination_reasons:
-        df_eliminated = pd.DataFrame(elimination_reasons)
-        df_eliminated.to_csv('eliminated_records_2025.csv', index=False)
-        print(f"   Elimination report: eliminated_records_2025.csv")
-        
-        # Show elimination breakdown
-        issue_counts = {}
-        for record in elimination_reasons:
-            for issue in record['issues'].split('; '):
-                issue_counts[issue.split(':')[0]] = issue_counts.get(issue.split(':')[0], 0) + 1
-        
-        print(f"\n📊 ELIMINATION BREAKDOWN:")
-        for issue, count in sorted(issue_counts.items(), key=lambda x: x[1], reverse=True):
-            print(f"   {issue}: {count} records")
+    # Save elimination report, only when there is something to report
+    if not elimination_reasons.empty:
+        save_eliminated(elimination_reasons, issue_counts)
+    else:
+        # Remove the report of an earlier run, so it is never read as this run's report
+        Path(ELIMINATED_FILE).unlink(missing_ok=True)
     
     return len(processed_records), len(elimination_reasons)
 
+def save_eliminated(elimination_reasons, issue_counts):
+    """Save the elimination report and show the elimination breakdown."""
+    elimination_reasons.to_csv(ELIMINATED_FILE, index=False, lineterminator='\n')
+    print(f"   Elimination report: {ELIMINATED_FILE}")
+    
+    # Show elimination breakdown
+    print(f"\n📊 ELIMINATION BREAKDOWN:")
+    for issue, count in sorted(issue_counts.items(), key=lambda x: x[1], reverse=True):
+        print(f"   {issue}: {count} records")
+
+def show_sample_eliminated(eliminated_df, sample_size=10):
+    """Display a sample of eliminated records for quick review."""
+    
+    print(f"\nSAMPLE OF ELIMINATED RECORDS (showing first {sample_size})")
+    print("=" * 80)
+    
+    for i, record in enumerate(eliminated_df.head(sample_size).itertuples(), 1):
+        print(f"\n🚫 RECORD #{i} (Index: {record.index})")
+        print(f"   Currency: {record.currency}")
+        print(f"   Experience: {record.experience} years")
+        print(f"   Language: {record.language}")
+        print(f"   Issues: {record.issues.replace('; ', ', ')}")
+    
+    if len(eliminated_df) > sample_size:
+        print(f"\n... and {len(eliminated_df) - sample_size} more records (see CSV for full details)")
+    
+    print(f"\n{'=' * 80}")
+
+def categorize_issues(eliminated_df):
+    """Categorize and count the types of issues."""
+    
+    # One regex over all issue prefixes categorizes every issue in a single pass
+    issues = eliminated_df['issues'].str.split('; ').explode()
+    categories = issues.str.extract(ISSUE_PATTERN, expand=False).map(ISSUE_CATEGORIES).fillna("Other")
+    issue_categories = categories.value_counts()
+    
+    print("\n📊 ISSUE BREAKDOWN:")
+    print("=" * 50)
+    total_issues = issue_categories.sum()
+    for category, count in issue_categories.items():
+        percentage = (count / total_issues) * 100
+        print(f"  {category}: {count} ({percentage:.1f}%)")
+    print(f"  TOTAL ISSUES: {total_issues}")
+
+def show_eliminated(eliminated_df, processed_count):
+    """Show the report of all eliminated records."""
+    print("COLOMBIA SALARY SURVEY 2025 - ALL ELIMINATED RECORDS")
+    print("=" * 80)
+    
+    # Every original record is either processed or eliminated
+    eliminated_count = len(eliminated_df)
+    original_count = processed_count + eliminated_count
+    print(f"📊 Dataset Overview:")
+    print(f"   Original records: {original_count:,}")
+    print(f"   Processed records: {processed_count:,}")
+    print(f"   Eliminated records: {eliminated_count:,} ({eliminated_count/original_count*100:.1f}%)")
+    
+    # Show breakdown of issues
+    categorize_issues(eliminated_df)
+    
+    # Show sample of eliminated records
+    show_sample_eliminated(eliminated_df)
+    
+    print(f"\n✅ COMPLETE!")
+    print(f"   All {eliminated_count} eliminated records are in: {ELIMINATED_FILE}")
+    print(f"   Open the CSV file to explore the data in detail.")
+
+def parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Process the Colombia Salary Survey 2025 data.")
+    parser.add_argument(
+        '--show-eliminated',
+        action='store_true',
+        help="also show the eliminated records report, using the records processed in this run"
+    )
+    return parser.parse_args()
+
 def main():
     """Main processing function."""
+    args = parse_args()
     print("COLOMBIA SALARY SURVEY 2025 - DATA PROCESSING")
     print("=" * 60)
     
     try:
         # Process the data
-        processed_records, elimination_reasons = load_and_process_data()
+        processed_records, elimination_reasons, issue_counts = load_and_process_data()
         
         # Save results
-        processed_count, eliminated_count = save_processed_data(processed_records, elimination_reasons)
+        processed_count, eliminated_count = save_processed_data(processed_records, elimination_reasons, issue_counts)
         
         # Summary
         total_original = processed_count + eliminated_count
@@ -289,6 +413,11 @@ def main():
         print(f"   Elimination rate: {elimination_rate:.1f}%")
         
         print(f"\n✅ Data processing complete. The processed data is ready for the React application.")
+        
+        # The eliminated records are already in memory, so the report needs no second load
+        if args.show_eliminated and eliminated_count:
+            print()
+            show_eliminated(elimination_reasons, processed_count)
     
     except Exception as e:
         print(f"ERROR: {str(e)}")
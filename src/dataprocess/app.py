@@ -3,21 +3,33 @@ import numpy as np
 
 salaryData=pd.read_csv("data/salaries-basedata.csv", sep=',',encoding='utf-8')
 
-salaryData['min-experience']=salaryData['experience'].replace(['Menos de 1 año','1+ año','2+ años','3 - 5 años','5 - 10 años','10 - 15 años','Más de 15 años'], [0,1,2,3,5,10,15]).astype(int)
-salaryData['max-experience']=salaryData['experience'].replace(['Menos de 1 año','1+ año','2+ años','3 - 5 años','5 - 10 años','10 - 15 años','Más de 15 años'], [0,1,2,4,9,14,15]).astype(int)
+# Answer text -> numeric code mappings; each dict is hashed once and applied to the column
+minExperience={'Menos de 1 año':0,'1+ año':1,'2+ años':2,'3 - 5 años':3,'5 - 10 años':5,'10 - 15 años':10,'Más de 15 años':15}
+maxExperience={'Menos de 1 año':0,'1+ año':1,'2+ años':2,'3 - 5 años':4,'5 - 10 años':9,'10 - 15 años':14,'Más de 15 años':15}
+englishLevels={'Ninguno':0,'Básico (puede leer documentación y código en inglés)':1,'Intermedio (puede pasar una entrevista de programación en ingles cómodamente)':2,'Avanzado (puede liderar una reunion de varias personas en ingles cómodamente)':3,'Nativo':4}
+titles={'Ninguno':0,'Bachiller':1,'Técnico':2,'Tecnólogo':3,'Pregrado':4,'Especialista':5,'Maestría':6,'Doctorado':7}
+workmodes={'Presencial (ocupa más del 60% de su tiempo en una oficina)':'Presencial',
+ 'Remoto (ocupa más del 70% de su tiempo trabajando en casa, cowork o un Café)':'Remoto',
+ 'Teletrabajo (100% trabajo en casa, debido a que así lo indica el contrato)':'Remoto',
+ 'Flexible (va a la oficina, pero puede trabajar desde casa cuando quiera)':'Flexible'}
 
+# The answers repeat a handful of values, so map them as categories
+experience=salaryData['experience'].astype('category')
+salaryData['min-experience']=experience.map(minExperience).astype('int8')
+salaryData['max-experience']=experience.map(maxExperience).astype('int8')
 
-salaryData['english-level']=salaryData['english-level'].replace(['Ninguno','Básico (puede leer documentación y código en inglés)','Intermedio (puede pasar una entrevista de programación en ingles cómodamente)','Avanzado (puede liderar una reunion de varias personas en ingles cómodamente)','Nativo'], [0,1,2,3,4]).astype(int)
 
-salaryData['max-title']=salaryData['max-title'].replace(['Ninguno','Bachiller','Técnico','Tecnólogo','Pregrado','Especialista','Maestría','Doctorado'],[0,1,2,3,4,5,6,7]).astype(int)
+salaryData['english-level']=salaryData['english-level'].astype('category').map(englishLevels).astype('int8')
 
-salaryData['income-in-currency'] = salaryData['income-in-currency'].replace('[\$,]', '', regex=True).astype(float)
+salaryData['max-title']=salaryData['max-title'].astype('category').map(titles).astype('int8')
+
+# Plain (non-regex) removal of the thousands separators and currency sign; malformed values become NaN
+income=salaryData['income-in-currency'].astype(str).str.replace(',', '', regex=False).str.replace('$', '', regex=False)
+salaryData['income-in-currency'] = pd.to_numeric(income, errors='coerce').astype(float)
 salaryData['main-programming-language']=salaryData['main-programming-language'].replace(["ninguno, por que soy manager 😭","no puedo decir, revelaría mi identidad secreta."],["Ninguno","Sin Respuesta"])
 salaryData['main-programming-language']=salaryData['main-programming-language'].fillna("Sin Respuesta")
-salaryData['workmode']=salaryData['workmode'].replace(['Presencial (ocupa más del 60% de su tiempo en una oficina)',
- 'Remoto (ocupa más del 70% de su tiempo trabajando en casa, cowork o un Café)',
- 'Teletrabajo (100% trabajo en casa, debido a que así lo indica el contrato)',
- 'Flexible (va a la oficina, pero puede trabajar desde casa cuando quiera)'],['Presencial','Remoto','Remoto','Flexible'])
+# Unlisted workmodes are kept as they are
+salaryData['workmode']=salaryData['workmode'].map(workmodes).fillna(salaryData['workmode'])
 salaryData['workmode']=salaryData['workmode'].fillna("Sin Respuesta")
 print(salaryData['main-programming-language'].unique())
 